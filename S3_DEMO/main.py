@@ -1,32 +1,145 @@
-import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import copy
+import importlib.util
+import logging
+import mimetypes
 import os
-import json
+import shutil
+
+# boto3, botocore.config, awscrt, aioboto3 and asyncio are imported where they are
+# first needed: loading them takes ~100 ms, which scripts that never reach S3 should
+# not pay.
+_CRT_AVAILABLE = importlib.util.find_spec('awscrt') is not None
+_AIOBOTO3_AVAILABLE = importlib.util.find_spec('aioboto3') is not None
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+# Size of each read when streaming an object body to disk.
+_IO_BUFFER_SIZE = 1 * _MB
+
+# Files below this size are uploaded with a single put_object call.
+_SMALL_OBJECT_THRESHOLD = 5 * _MB
+
+# Maximum number of keys accepted by a single DeleteObjects request.
+_DELETE_BATCH_SIZE = 1000
+
+# Transfers are network-bound, so use more threads than cores.
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 5)
+
+# Public read policy, serialized once; '__BUCKET__' is replaced with the bucket name.
+_PUBLIC_READ_POLICY_TEMPLATE = (
+    '{"Version":"2012-10-17","Statement":[{"Sid":"AddPerm","Effect":"Allow",'
+    '"Principal":"*","Action":["s3:GetObject"],"Resource":"arn:aws:s3:::__BUCKET__/*"}]}')
+
+# Client settings shared by the sync and async clients. Batch helpers cap their
+# threads at max_pool_connections and scale each transfer's max_concurrency down so
+# that threads * max_concurrency fits in the pool (see S3Helper._map_parallel).
+# Adaptive retries back off on 503 Slow Down.
+_CLIENT_CONFIG_OPTIONS = {
+    'max_pool_connections': 64,
+    'retries': {'max_attempts': 10, 'mode': 'adaptive'},
+    'tcp_keepalive': True,
+    'connect_timeout': 5,
+    'read_timeout': 60,
+}
+
+@lru_cache(maxsize=None)
+def _get_client(region=None):
+    """
+    Return the shared S3 client for a region, creating it on first use.
+
+    Sharing the client lets every S3Helper reuse the same session and connection pool.
+
+    :param region: AWS region of the client (optional).
+                   If None, the region from the AWS configuration is used.
+    """
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client('s3', region_name=region, config=Config(**_CLIENT_CONFIG_OPTIONS))
+
+def _list_objects_kwargs(bucket_name, prefix=None, start_after=None):
+    """
+    Build the ListObjectsV2 arguments shared by the sync and async listings.
+
+    :param bucket_name: Name of the bucket.
+    :param prefix: Only list keys starting with this prefix (optional).
+    :param start_after: Only list keys after this key (optional).
+    """
+    kwargs = {'Bucket': bucket_name}
+    if prefix:
+        kwargs['Prefix'] = prefix
+    if start_after:
+        kwargs['StartAfter'] = start_after
+    return kwargs
+
+class _KnownObjectSubscriber:
+    """
+    s3transfer subscriber that supplies an object's size and ETag from an earlier
+    HeadObject, so the download does not send another one.
+    """
+
+    def __init__(self, metadata):
+        self._size = metadata['ContentLength']
+        self._etag = metadata.get('ETag')
+
+    def on_queued(self, future, **kwargs):
+        # The CRT transfer manager sizes objects itself and has no such hooks.
+        if hasattr(future.meta, 'provide_transfer_size'):
+            future.meta.provide_transfer_size(self._size)
+            future.meta.provide_object_etag(self._etag)
 
 class S3Helper:
-    def __init__(self):
-        """Initialize the S3 client."""
-        self.s3_client = boto3.client('s3')
+    def __init__(self, client=None, region=None, transfer_config=None,
+                 small_object_threshold=_SMALL_OBJECT_THRESHOLD):
+        """
+        Initialize the S3 helper.
+
+        :param client: boto3 S3 client to use (optional).
+                       If None, the shared client for region is used.
+        :param region: AWS region of the shared client (optional, ignored if client is given).
+        :param transfer_config: TransferConfig used by uploads and downloads (optional).
+                                If None, a configuration tuned for large files is used,
+                                backed by the AWS Common Runtime when awscrt is installed.
+        :param small_object_threshold: Files smaller than this many bytes are uploaded
+                                       with put_object instead of s3transfer.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        self.s3_client = client or _get_client(region)
+        self._transfer_config = transfer_config or TransferConfig(
+            multipart_threshold=64 * _MB,
+            multipart_chunksize=32 * _MB,
+            max_concurrency=16,
+            io_chunksize=_IO_BUFFER_SIZE,
+            use_threads=True,
+            preferred_transfer_client='crt' if _CRT_AVAILABLE else 'auto')
+        self._small_threshold = small_object_threshold
 
     def create_bucket(self, bucket_name, region=None):
         """
         Create an S3 bucket in a specified region.
 
         :param bucket_name: Name of the bucket to create.
-        :param region: AWS region to create the bucket in (default: us-east-1).
+        :param region: AWS region to create the bucket in (default: the client's region).
         :return: True if bucket created successfully, otherwise False.
         """
+        region = region or self.s3_client.meta.region_name
+        kwargs = {'Bucket': bucket_name}
+        # us-east-1 is the default location and rejects an explicit constraint.
+        if region not in (None, 'us-east-1'):
+            kwargs['CreateBucketConfiguration'] = {'LocationConstraint': region}
         try:
-            if region is None:
-                self.s3_client.create_bucket(Bucket=bucket_name)
-            else:
-                location = {'LocationConstraint': region}
-                self.s3_client.create_bucket(Bucket=bucket_name,
-                                             CreateBucketConfiguration=location)
-            print(f"Bucket '{bucket_name}' created successfully.")
+            self.s3_client.create_bucket(**kwargs)
+            logger.info("Bucket %r created successfully.", bucket_name)
             return True
         except ClientError as e:
-            print(f"Error creating bucket '{bucket_name}': {e}")
+            logger.error("Error creating bucket %r: %s", bucket_name, e)
             return False
 
     def list_buckets(self):
@@ -35,11 +148,11 @@ class S3Helper:
         """
         try:
             response = self.s3_client.list_buckets()
-            print("Existing buckets:")
+            logger.info("Existing buckets:")
             for bucket in response['Buckets']:
-                print(f" - {bucket['Name']}")
+                logger.info(" - %s", bucket['Name'])
         except ClientError as e:
-            print(f"Error listing buckets: {e}")
+            logger.error("Error listing buckets: %s", e)
 
     def delete_bucket(self, bucket_name):
         """
@@ -49,43 +162,329 @@ class S3Helper:
         """
         try:
             self.s3_client.delete_bucket(Bucket=bucket_name)
-            print(f"Bucket '{bucket_name}' deleted successfully.")
+            logger.info("Bucket %r deleted successfully.", bucket_name)
         except ClientError as e:
-            print(f"Error deleting bucket '{bucket_name}': {e}")
+            logger.error("Error deleting bucket %r: %s", bucket_name, e)
 
     def upload_file(self, file_path, bucket_name, object_name=None):
         """
         Upload a file to an S3 bucket.
 
+        Small files are sent with a single put_object call; larger ones go through
+        s3transfer. The Content-Type is guessed from the file name and the
+        modification time is stored in the 'mtime' metadata entry (in nanoseconds).
+
         :param file_path: Path to the file to upload.
         :param bucket_name: Name of the bucket to upload the file to.
         :param object_name: Name of the object in the bucket (optional).
                             If None, the file name is used.
         :return: True if file was uploaded successfully, otherwise False.
         """
+        from boto3.exceptions import S3UploadFailedError
+
         object_name = object_name or os.path.basename(file_path)
         try:
-            self.s3_client.upload_file(file_path, bucket_name, object_name)
-            print(f"File '{file_path}' uploaded to bucket '{bucket_name}' as '{object_name}'.")
+            stat = os.stat(file_path)
+            # The local mtime lets later syncs compare files without downloading them.
+            extra_args = {'Metadata': {'mtime': str(stat.st_mtime_ns)}}
+            content_type = mimetypes.guess_type(file_path)[0]
+            if content_type:
+                extra_args['ContentType'] = content_type
+            if stat.st_size < self._small_threshold:
+                with open(file_path, 'rb') as file:
+                    self.s3_client.put_object(Bucket=bucket_name, Key=object_name,
+                                              Body=file, **extra_args)
+            else:
+                self.s3_client.upload_file(file_path, bucket_name, object_name,
+                                           ExtraArgs=extra_args,
+                                           Config=self._transfer_config)
+            logger.info("File %r uploaded to bucket %r as %r.", file_path, bucket_name, object_name)
             return True
-        except ClientError as e:
-            print(f"Error uploading file '{file_path}': {e}")
+        except (ClientError, OSError, S3UploadFailedError) as e:
+            logger.error("Error uploading file %r: %s", file_path, e)
             return False
 
+    def exists(self, bucket_name, object_name):
+        """
+        Check whether an object exists, with a HEAD request.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :return: True if the object exists, otherwise False.
+        :raises ClientError: if the check fails for another reason (e.g. access denied).
+        """
+        return self._head_object(bucket_name, object_name) is not None
+
     def download_file(self, bucket_name, object_name, download_path):
         """
         Download a file from an S3 bucket.
 
+        The object is checked with a HEAD request first, so nothing is written
+        locally when it does not exist. Small objects are fetched with a single
+        GET; larger ones go through s3transfer.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object to download.
+        :param download_path: Path where the downloaded file will be saved.
+        :return: True if file was downloaded successfully, otherwise False.
+        """
+        try:
+            metadata = self._head_object(bucket_name, object_name)
+        except ClientError as e:
+            logger.error("Error downloading file %r: %s", object_name, e)
+            return False
+        if metadata is None:
+            logger.error("Error downloading file %r: object not found in bucket %r.",
+                         object_name, bucket_name)
+            return False
+        if metadata['ContentLength'] < self._transfer_config.multipart_threshold:
+            return self.download_small(bucket_name, object_name, download_path)
+        return self._download_large(bucket_name, object_name, download_path, metadata)
+
+    def download_small(self, bucket_name, object_name, download_path):
+        """
+        Download a small object with a single GET, bypassing s3transfer.
+
+        Objects at or above the multipart threshold are downloaded with s3transfer.
+        If the transfer fails midway, the partially written file is removed.
+
         :param bucket_name: Name of the bucket.
         :param object_name: Name of the object to download.
         :param download_path: Path where the downloaded file will be saved.
+        :return: True if file was downloaded successfully, otherwise False.
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=bucket_name, Key=object_name)
+        except ClientError as e:
+            logger.error("Error downloading file %r: %s", object_name, e)
+            return False
+        body = response['Body']
+        content_length = response['ContentLength']
+        if content_length >= self._transfer_config.multipart_threshold:
+            body.close()
+            return self._download_large(bucket_name, object_name, download_path)
+        try:
+            file = open(download_path, 'wb')
+        except OSError as e:
+            body.close()
+            logger.error("Error downloading file %r: %s", object_name, e)
+            return False
+        try:
+            with file:
+                if content_length and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(file.fileno(), 0, content_length)
+                    except OSError:
+                        pass
+                shutil.copyfileobj(body, file, _IO_BUFFER_SIZE)
+        except (BotoCoreError, OSError) as e:
+            # The file was preallocated to its full size, so a partial copy would
+            # look complete; remove it instead.
+            os.remove(download_path)
+            logger.error("Error downloading file %r: %s", object_name, e)
+            return False
+        finally:
+            body.close()
+        logger.info("File %r downloaded from bucket %r to %r.",
+                    object_name, bucket_name, download_path)
+        return True
+
+    def _download_large(self, bucket_name, object_name, download_path, metadata=None):
+        """
+        Download an object with s3transfer, using ranged GETs for large objects.
+
+        s3transfer writes to a temporary file and renames it when done, so a failed
+        download leaves nothing at download_path.
+
+        :param metadata: head_object response for the object (optional). When given,
+                         s3transfer reuses it instead of sending its own HeadObject.
+        """
+        from boto3.s3.transfer import create_transfer_manager
+        from s3transfer.exceptions import RetriesExceededError
+
+        subscribers = [_KnownObjectSubscriber(metadata)] if metadata else None
+        try:
+            with create_transfer_manager(self.s3_client, self._transfer_config) as manager:
+                manager.download(bucket_name, object_name, download_path,
+                                 subscribers=subscribers).result()
+            logger.info("File %r downloaded from bucket %r to %r.",
+                        object_name, bucket_name, download_path)
+            return True
+        except (BotoCoreError, ClientError, OSError, RetriesExceededError) as e:
+            logger.error("Error downloading file %r: %s", object_name, e)
+            return False
+
+    def _head_object(self, bucket_name, object_name):
+        """
+        Retrieve the metadata of an object.
+
+        :return: The head_object response, or None if the object does not exist.
+        :raises ClientError: for any error other than a missing object.
+        """
+        try:
+            return self.s3_client.head_object(Bucket=bucket_name, Key=object_name)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                return None
+            raise
+
+    def upload_files(self, files, bucket_name, max_workers=None):
+        """
+        Upload several files to an S3 bucket in parallel.
+
+        :param files: Iterable of (file_path, object_name) pairs.
+                      object_name may be None to use the file name.
+        :param bucket_name: Name of the bucket to upload the files to.
+        :param max_workers: Maximum number of concurrent uploads (optional).
+        :return: List with the result of each upload, in order.
+        """
+        return self._map_parallel(
+            lambda helper, pair: helper.upload_file(pair[0], bucket_name, pair[1]),
+            files, max_workers)
+
+    def download_files(self, bucket_name, objects, max_workers=None):
+        """
+        Download several objects from an S3 bucket in parallel.
+
+        :param bucket_name: Name of the bucket.
+        :param objects: Iterable of (object_name, download_path) pairs.
+        :param max_workers: Maximum number of concurrent downloads (optional).
+        :return: List with the result of each download, in order.
+        """
+        return self._map_parallel(
+            lambda helper, pair: helper.download_file(bucket_name, pair[0], pair[1]),
+            objects, max_workers)
+
+    def copy_object(self, src_bucket, src_key, dst_bucket, dst_key):
+        """
+        Copy an object inside S3, without downloading it.
+
+        Large objects are copied in parts with UploadPartCopy.
+
+        :param src_bucket: Name of the source bucket.
+        :param src_key: Name of the source object.
+        :param dst_bucket: Name of the destination bucket.
+        :param dst_key: Name of the destination object.
+        :return: True if object was copied successfully, otherwise False.
+        """
+        try:
+            self.s3_client.copy(CopySource={'Bucket': src_bucket, 'Key': src_key},
+                                Bucket=dst_bucket, Key=dst_key,
+                                Config=self._transfer_config)
+            logger.info("Object '%s/%s' copied to '%s/%s'.", src_bucket, src_key, dst_bucket, dst_key)
+            return True
+        except ClientError as e:
+            logger.error("Error copying object %r: %s", src_key, e)
+            return False
+
+    def copy_prefix(self, src_bucket, src_prefix, dst_bucket, dst_prefix, max_workers=None):
+        """
+        Copy every object under a prefix to another prefix, in parallel.
+
+        All keys are listed before the first copy starts, so copies landing under
+        src_prefix (e.g. 'a/' to 'a/backup/') are not picked up and copied again.
+
+        :param src_bucket: Name of the source bucket.
+        :param src_prefix: Prefix of the objects to copy.
+        :param dst_bucket: Name of the destination bucket.
+        :param dst_prefix: Prefix that replaces src_prefix in the copied keys.
+        :param max_workers: Maximum number of concurrent copies (optional).
+        :return: True if all objects were copied successfully, otherwise False.
         """
         try:
-            with open(download_path, 'wb') as file:
-                self.s3_client.download_fileobj(bucket_name, object_name, file)
-            print(f"File '{object_name}' downloaded from bucket '{bucket_name}' to '{download_path}'.")
+            keys = [obj['Key'] for obj in self._iter_objects(src_bucket, src_prefix)]
         except ClientError as e:
-            print(f"Error downloading file '{object_name}': {e}")
+            logger.error("Error listing objects in bucket %r: %s", src_bucket, e)
+            return False
+        results = self._map_parallel(
+            lambda helper, key: helper.copy_object(src_bucket, key, dst_bucket,
+                                                   dst_prefix + key[len(src_prefix):]),
+            keys, max_workers)
+        return all(results)
+
+    def generate_upload_url(self, bucket_name, object_name, expires_in=3600):
+        """
+        Generate a presigned URL that lets a client upload an object directly with PUT.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object to upload.
+        :param expires_in: Seconds until the URL expires (default: 3600).
+        :return: The presigned URL, or None on error.
+        """
+        return self._generate_presigned_url('put_object', bucket_name, object_name, expires_in)
+
+    def generate_download_url(self, bucket_name, object_name, expires_in=3600):
+        """
+        Generate a presigned URL that lets a client download an object directly with GET.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object to download.
+        :param expires_in: Seconds until the URL expires (default: 3600).
+        :return: The presigned URL, or None on error.
+        """
+        return self._generate_presigned_url('get_object', bucket_name, object_name, expires_in)
+
+    def generate_upload_urls(self, bucket_name, object_names, expires_in=3600):
+        """
+        Generate presigned upload URLs for several objects at once.
+
+        :param bucket_name: Name of the bucket.
+        :param object_names: Iterable of object names.
+        :param expires_in: Seconds until the URLs expire (default: 3600).
+        :return: Dict mapping each object name to its presigned URL.
+        """
+        return {object_name: self.generate_upload_url(bucket_name, object_name, expires_in)
+                for object_name in object_names}
+
+    def _generate_presigned_url(self, client_method, bucket_name, object_name, expires_in):
+        """
+        Generate a presigned URL for the given client method.
+
+        Signing is done locally, so no request is sent to S3 and failures such as
+        missing credentials or invalid parameters surface as BotoCoreError.
+        """
+        try:
+            return self.s3_client.generate_presigned_url(
+                client_method,
+                Params={'Bucket': bucket_name, 'Key': object_name},
+                ExpiresIn=expires_in)
+        except BotoCoreError as e:
+            logger.error("Error generating presigned URL for %r: %s", object_name, e)
+            return None
+
+    def _map_parallel(self, func, items, max_workers=None):
+        """
+        Apply func to every item using a thread pool.
+
+        All threads share the client's connection pool. So the thread count is capped
+        at the pool size, and func gets a copy of this helper whose transfers use at most
+        pool_size // threads connections each. A large transfer per thread then cannot
+        exhaust the pool and lose keep-alive connections.
+
+        An unexpected exception from one item is logged and recorded as False for
+        that item, so it does not discard the results of the rest of the batch.
+
+        :param func: Callable taking the batch helper and a single item.
+        :param items: Iterable of items.
+        :param max_workers: Maximum number of threads (optional).
+        :return: List of results, in the order of items.
+        """
+        pool_size = self.s3_client.meta.config.max_pool_connections
+        max_workers = min(max_workers or _DEFAULT_MAX_WORKERS, pool_size)
+        helper = copy.copy(self)
+        helper._transfer_config = copy.copy(self._transfer_config)
+        helper._transfer_config.max_concurrency = max(
+            1, min(self._transfer_config.max_concurrency, pool_size // max_workers))
+
+        def run(item):
+            try:
+                return func(helper, item)
+            except Exception:
+                logger.exception("Error processing batch item %r", item)
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, items))
 
     def delete_object(self, bucket_name, object_name):
         """
@@ -96,38 +495,89 @@ class S3Helper:
         """
         try:
             self.s3_client.delete_object(Bucket=bucket_name, Key=object_name)
-            print(f"Object '{object_name}' deleted from bucket '{bucket_name}'.")
+            logger.info("Object %r deleted from bucket %r.", object_name, bucket_name)
         except ClientError as e:
-            print(f"Error deleting object '{object_name}': {e}")
+            logger.error("Error deleting object %r: %s", object_name, e)
 
-    def list_objects(self, bucket_name):
+    def delete_objects(self, bucket_name, object_names):
         """
-        List all objects in an S3 bucket.
+        Delete several objects from an S3 bucket, up to 1000 keys per request.
+
+        :param bucket_name: Name of the bucket.
+        :param object_names: Iterable of object names to delete.
+        :return: True if all objects were deleted successfully, otherwise False.
+        """
+        object_names = iter(object_names)
+        success = True
+        while True:
+            batch = list(islice(object_names, _DELETE_BATCH_SIZE))
+            if not batch:
+                return success
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True})
+            except ClientError as e:
+                logger.error("Error deleting objects from bucket %r: %s", bucket_name, e)
+                success = False
+                continue
+            errors = response.get('Errors', ())
+            for error in errors:
+                logger.error("Error deleting object %r: %s", error['Key'], error['Message'])
+                success = False
+            logger.info("%d objects deleted from bucket %r.", len(batch) - len(errors), bucket_name)
+
+    def delete_prefix(self, bucket_name, prefix):
+        """
+        Delete every object under a prefix from an S3 bucket.
 
         :param bucket_name: Name of the bucket.
+        :param prefix: Prefix of the objects to delete.
+        :return: True if all objects were deleted successfully, otherwise False.
         """
         try:
-            response = self.s3_client.list_objects_v2(Bucket=bucket_name)
-            print(f"Objects in bucket '{bucket_name}':")
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    print(f" - {obj['Key']} (Size: {obj['Size']} bytes)")
-            else:
-                print("No objects found in the bucket.")
+            return self.delete_objects(
+                bucket_name, (obj['Key'] for obj in self._iter_objects(bucket_name, prefix)))
         except ClientError as e:
-            print(f"Error listing objects in bucket '{bucket_name}': {e}")
+            logger.error("Error listing objects in bucket %r: %s", bucket_name, e)
+            return False
+
+    def list_objects(self, bucket_name, prefix=None, start_after=None):
+        """
+        Iterate over all objects in an S3 bucket, one page at a time.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Only list keys starting with this prefix (optional).
+        :param start_after: Only list keys after this key, skipped by S3 itself (optional).
+        :return: Generator yielding the object summaries ('Key', 'Size', ...).
+        """
+        try:
+            yield from self._iter_objects(bucket_name, prefix, start_after)
+        except ClientError as e:
+            logger.error("Error listing objects in bucket %r: %s", bucket_name, e)
+
+    def _iter_objects(self, bucket_name, prefix=None, start_after=None):
+        """
+        Iterate over the objects in an S3 bucket, letting listing errors propagate.
+
+        :raises ClientError: if a page cannot be listed.
+        """
+        kwargs = _list_objects_kwargs(bucket_name, prefix, start_after)
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(**kwargs, PaginationConfig={'PageSize': 1000}):
+            yield from page.get('Contents', ())
 
     def get_bucket_policy(self, bucket_name):
         """
-        Retrieve and print the bucket policy.
+        Retrieve and log the bucket policy.
 
         :param bucket_name: Name of the bucket.
         """
         try:
             result = self.s3_client.get_bucket_policy(Bucket=bucket_name)
-            print(f"Bucket policy for '{bucket_name}': {result['Policy']}")
+            logger.info("Bucket policy for %r: %s", bucket_name, result['Policy'])
         except ClientError as e:
-            print(f"Error retrieving policy for bucket '{bucket_name}': {e}")
+            logger.error("Error retrieving policy for bucket %r: %s", bucket_name, e)
 
     def set_bucket_policy(self, bucket_name):
         """
@@ -135,42 +585,155 @@ class S3Helper:
 
         :param bucket_name: Name of the bucket.
         """
-        bucket_policy = {
-            'Version': '2024-10-17',
-            'Statement': [{
-                'Sid': 'AddPerm',
-                'Effect': 'Allow',
-                'Principal': '*',
-                'Action': ['s3:GetObject'],
-                'Resource': f'arn:aws:s3:::{bucket_name}/*'
-            }]
-        }
-        try:
-            self.s3_client.put_bucket_policy(Bucket=bucket_name, Policy=json.dumps(bucket_policy))
-            print(f"Public read policy set for bucket '{bucket_name}'.")
+        policy = _PUBLIC_READ_POLICY_TEMPLATE.replace('__BUCKET__', bucket_name)
+        try:
+            self.s3_client.put_bucket_policy(Bucket=bucket_name, Policy=policy)
+            logger.info("Public read policy set for bucket %r.", bucket_name)
+        except ClientError as e:
+            logger.error("Error setting policy for bucket %r: %s", bucket_name, e)
+
+class AsyncS3Helper:
+    """
+    Asynchronous S3 helper, for issuing many independent requests concurrently.
+
+    Requires aioboto3. Use it as an async context manager:
+
+        async with AsyncS3Helper() as helper:
+            buckets, objects = await asyncio.gather(helper.list_buckets(),
+                                                    helper.list_objects(bucket_name))
+    """
+
+    def __init__(self, region=None):
+        """
+        Initialize the asynchronous S3 helper.
+
+        :param region: AWS region of the client (optional).
+        """
+        try:
+            import aioboto3
+        except ImportError:
+            raise ImportError("AsyncS3Helper requires the 'aioboto3' package.") from None
+        self._session = aioboto3.Session()
+        self._region = region
+        self._exit_stack = None
+        self._client = None
+
+    async def __aenter__(self):
+        from contextlib import AsyncExitStack
+
+        from aiobotocore.config import AioConfig
+
+        self._exit_stack = AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(
+            self._session.client('s3', region_name=self._region,
+                                 config=AioConfig(**_CLIENT_CONFIG_OPTIONS)))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._exit_stack.aclose()
+        self._client = None
+
+    async def list_buckets(self):
+        """
+        List all buckets in the S3 account.
+
+        :return: List of bucket names.
+        """
+        try:
+            response = await self._client.list_buckets()
+            return [bucket['Name'] for bucket in response['Buckets']]
+        except ClientError as e:
+            logger.error("Error listing buckets: %s", e)
+            return []
+
+    async def list_objects(self, bucket_name, prefix=None, start_after=None):
+        """
+        List all objects in an S3 bucket.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Only list keys starting with this prefix (optional).
+        :param start_after: Only list keys after this key, skipped by S3 itself (optional).
+        :return: List of object summaries ('Key', 'Size', ...).
+        """
+        kwargs = _list_objects_kwargs(bucket_name, prefix, start_after)
+        paginator = self._client.get_paginator('list_objects_v2')
+        objects = []
+        try:
+            async for page in paginator.paginate(**kwargs, PaginationConfig={'PageSize': 1000}):
+                objects.extend(page.get('Contents', ()))
         except ClientError as e:
-            print(f"Error setting policy for bucket '{bucket_name}': {e}")
+            logger.error("Error listing objects in bucket %r: %s", bucket_name, e)
+        return objects
+
+async def log_overview(bucket_names, region=None):
+    """
+    Log all buckets and the objects of the given buckets, fetched concurrently.
+
+    :param bucket_names: Names of the buckets whose objects are logged.
+    :param region: AWS region of the client (optional).
+    """
+    import asyncio
+
+    async with AsyncS3Helper(region) as helper:
+        buckets, *objects = await asyncio.gather(
+            helper.list_buckets(),
+            *(helper.list_objects(bucket_name) for bucket_name in bucket_names))
+    logger.info("Existing buckets:")
+    for name in buckets:
+        logger.info(" - %s", name)
+    for bucket_name, bucket_objects in zip(bucket_names, objects):
+        _log_object_list(bucket_name, bucket_objects)
+
+def log_objects(s3_helper, bucket_name):
+    """
+    Log all objects in an S3 bucket.
+
+    :param s3_helper: S3Helper used to list the objects.
+    :param bucket_name: Name of the bucket.
+    """
+    _log_object_list(bucket_name, s3_helper.list_objects(bucket_name))
+
+def _log_object_list(bucket_name, objects):
+    """
+    Log the given objects of an S3 bucket, one per line.
+
+    :param bucket_name: Name of the bucket.
+    :param objects: Iterable of object summaries ('Key', 'Size', ...).
+    """
+    logger.info("Objects in bucket %r:", bucket_name)
+    found = False
+    for obj in objects:
+        found = True
+        logger.info(" - %s (Size: %s bytes)", obj['Key'], obj['Size'])
+    if not found:
+        logger.info("No objects found in the bucket.")
 
 if __name__ == '__main__':
-    s3_helper = S3Helper()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
     bucket_name = "testing-bucket-unisinos"
     region = "sa-east-1"
 
+    s3_helper = S3Helper(region=region)
+
     # List buckets
     s3_helper.list_buckets()
 
     # Create a bucket
-    s3_helper.create_bucket(bucket_name, region)
-
-    # List buckets again
-    s3_helper.list_buckets()
+    s3_helper.create_bucket(bucket_name)
 
     # Upload a file
     s3_helper.upload_file("test_file.txt", bucket_name)
 
-    # List objects in the bucket
-    s3_helper.list_objects(bucket_name)
+    # List buckets again and the objects in the bucket; the two listings are
+    # independent, so they run concurrently when aioboto3 is installed
+    if _AIOBOTO3_AVAILABLE:
+        import asyncio
+
+        asyncio.run(log_overview([bucket_name], region))
+    else:
+        s3_helper.list_buckets()
+        log_objects(s3_helper, bucket_name)
 
     # Download the file from the bucket
     s3_helper.download_file(bucket_name, "test_file.txt", "downloaded_test_file.txt")
@@ -179,7 +742,7 @@ if __name__ == '__main__':
     s3_helper.delete_object(bucket_name, "test_file.txt")
 
     # List objects in the bucket again
-    s3_helper.list_objects(bucket_name)
+    log_objects(s3_helper, bucket_name)
 
     # Delete the bucket
     s3_helper.delete_bucket(bucket_name)